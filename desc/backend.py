@@ -77,7 +77,7 @@ def _diag_to_full(d, e):
 
 
 if use_jax:  # noqa: C901
-    from jax import custom_jvp, jit, vmap
+    from jax import custom_jvp, ensure_compile_time_eval, jit, vmap
     from jax.experimental.ode import odeint
     from jax.lax import cond, fori_loop, scan, switch, while_loop
     from jax.nn import softmax as softargmax
@@ -527,6 +527,8 @@ if use_jax:  # noqa: C901
 else:  # pragma: no cover
     jit = lambda func, *args, **kwargs: func
     execute_on_cpu = lambda func: func
+    from contextlib import nullcontext as ensure_compile_time_eval  # noqa: F401
+
     import scipy.optimize
     from numpy.fft import ifft, irfft, irfft2, rfft, rfft2  # noqa: F401
     from scipy.fft import dct, idct  # noqa: F401
@@ -8,11 +8,7 @@ from desc.backend import jit, jnp
 
 from ..batching import batch_map
 from ..integrals.bounce_integral import Bounce2D
-from ..integrals.quad_utils import (
-    automorphism_sin,
-    get_quadrature,
-    grad_automorphism_sin,
-)
+from ..integrals.quad_utils import _leggauss_sin
 from ..utils import cross, dot, safediv
 from ._neoclassical import _bounce_doc, _compute
 from .data_index import register_compute_fun
@@ -142,10 +138,7 @@ def _Gamma_c(params, transforms, profiles, data, **kwargs):
     quad = (
         kwargs["quad"]
         if "quad" in kwargs
-        else get_quadrature(
-            leggauss(kwargs.get("num_quad", 32)),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        else _leggauss_sin(kwargs.get("num_quad", 32))
     )
     nufft_eps = kwargs.get("nufft_eps", 1e-7)
     spline = kwargs.get("spline", True)
@@ -303,10 +296,7 @@ def _little_gamma_c_Nemov(params, transforms, profiles, data, **kwargs):
     quad = (
         kwargs["quad"]
         if "quad" in kwargs
-        else get_quadrature(
-            leggauss(kwargs.get("num_quad", 32)),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        else _leggauss_sin(kwargs.get("num_quad", 32))
     )
     nufft_eps = kwargs.get("nufft_eps", 1e-7)
     spline = kwargs.get("spline", True)
@@ -450,10 +440,7 @@ def _Gamma_c_Velasco(params, transforms, profiles, data, **kwargs):
     quad = (
         kwargs["quad"]
         if "quad" in kwargs
-        else get_quadrature(
-            leggauss(kwargs.get("num_quad", 32)),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        else _leggauss_sin(kwargs.get("num_quad", 32))
     )
     nufft_eps = kwargs.get("nufft_eps", 1e-7)
     spline = kwargs.get("spline", True)
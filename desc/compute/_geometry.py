@@ -1189,6 +1189,28 @@ def _curvature_H_zeta(params, transforms, profiles, data, **kwargs):
     return data
 
 
+def _mean_fieldline_integral(f, zeta):
+    """Integrate ``f`` along field lines and average over the field lines.
+
+    Parameters
+    ----------
+    f : jnp.ndarray
+        Shape (..., num alpha, num zeta).
+        Integrand reshaped to a (ρ, α, ζ) meshgrid.
+    zeta : jnp.ndarray
+        Shape (num zeta, ).
+        ζ coordinates of the meshgrid.
+
+    Returns
+    -------
+    integral : jnp.ndarray
+        Shape (..., ).
+        Magnitude of the mean over α of the integral of ``f`` over ζ.
+
+    """
+    return jnp.abs(simpson(y=f, x=zeta, axis=-1).mean(axis=-1))
+
+
 @register_compute_fun(
     name="fieldline length",
     label="\\int_{\\zeta_{\\mathrm{min}}}^{\\zeta_{\\mathrm{max}}}"
@@ -1207,12 +1229,9 @@ def _curvature_H_zeta(params, transforms, profiles, data, **kwargs):
 def _fieldline_length(data, transforms, profiles, **kwargs):
     grid = transforms["grid"].source_grid
     data["fieldline length"] = grid.expand(
-        jnp.abs(
-            simpson(
-                y=grid.meshgrid_reshape(1 / data["B^zeta"], "raz"),
-                x=grid.compress(grid.nodes[:, 2], surface_label="zeta"),
-                axis=-1,
-            ).mean(axis=-1)
+        _mean_fieldline_integral(
+            grid.meshgrid_reshape(1 / data["B^zeta"], "raz"),
+            grid.compress(grid.nodes[:, 2], surface_label="zeta"),
         )
     )
     return data
@@ -1236,12 +1255,9 @@ def _fieldline_length(data, transforms, profiles, **kwargs):
 def _fieldline_length_over_volume(data, transforms, profiles, **kwargs):
     grid = transforms["grid"].source_grid
     data["fieldline length/volume"] = grid.expand(
-        jnp.abs(
-            simpson(
-                y=grid.meshgrid_reshape(1 / (data["B^zeta"] * data["sqrt(g)"]), "raz"),
-                x=grid.compress(grid.nodes[:, 2], surface_label="zeta"),
-                axis=-1,
-            ).mean(axis=-1)
+        _mean_fieldline_integral(
+            grid.meshgrid_reshape(1 / (data["B^zeta"] * data["sqrt(g)"]), "raz"),
+            grid.compress(grid.nodes[:, 2], surface_label="zeta"),
         )
     )
     return data
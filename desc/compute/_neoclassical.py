@@ -8,7 +8,7 @@ from desc.backend import jit, jnp
 
 from ..batching import batch_map
 from ..integrals.bounce_integral import Bounce2D
-from ..integrals.quad_utils import chebgauss2
+from ..integrals.quad_utils import _chebgauss2
 from ..utils import safediv
 from .data_index import register_compute_fun
 
@@ -110,7 +110,9 @@ def _compute(
     fun : callable
         Function to compute.
     fun_data : dict[str, jnp.ndarray]
+        Shape (grid.num_nodes, ).
         Data to provide to ``fun``. This dict will be modified.
+        Values must be scalar-valued functions evaluated on ``grid``.
     data : dict[str, jnp.ndarray]
         DESC data dict.
     theta : jnp.ndarray
@@ -135,8 +137,14 @@ def _compute(
     for name in Bounce2D.required_names:
         fun_data[name] = data[name]
     fun_data.pop("iota", None)
-    for name in fun_data:
-        fun_data[name] = Bounce2D.fourier(Bounce2D.reshape(grid, fun_data[name]))
+    # Stack the fields to reshape and transform them together in one batch.
+    names = list(fun_data)
+    assert all(
+        fun_data[name].shape == (grid.num_nodes,) for name in names
+    ), "Expected scalar-valued data on grid."
+    f = Bounce2D.reshape(grid, jnp.stack([fun_data[name] for name in names], axis=-1))
+    f = Bounce2D.fourier(jnp.moveaxis(f, -1, 0))
+    fun_data.update(zip(names, f))
     fun_data["iota"] = grid.compress(data["iota"])
     fun_data["theta"] = theta
     fun_data["pitch_inv"], fun_data["pitch_inv weight"] = Bounce2D.get_pitch_inv_quad(
@@ -227,8 +235,11 @@ def _epsilon_32(params, transforms, profiles, data, **kwargs):
     fl_quad = (
         kwargs["fieldline_quad"] if "fieldline_quad" in kwargs else leggauss(Y_B // 2)
     )
+    # Near the bounce points 1 - λB vanishes linearly in ζ, so after mapping
+    # the well to [-1, 1] the integrands are √(1−x²) times a smooth function.
+    # The weight of this rule absorbs that factor exactly.
     quad = (
-        kwargs["quad"] if "quad" in kwargs else chebgauss2(kwargs.get("num_quad", 32))
+        kwargs["quad"] if "quad" in kwargs else _chebgauss2(kwargs.get("num_quad", 32))
     )
     nufft_eps = kwargs.get("nufft_eps", 1e-6)
     spline = kwargs.get("spline", True)
@@ -265,16 +276,15 @@ def _epsilon_32(params, transforms, profiles, data, **kwargs):
             )
             return safediv(H**2, I).sum(-1).mean(-2)
 
-        return jnp.sum(
-            batch_map(fun, data["pitch_inv"], pitch_batch_size)
-            * data["pitch_inv weight"]
-            / data["pitch_inv"] ** 3,
-            axis=-1,
+        return jnp.einsum(
+            "...p,...p->...",
+            batch_map(fun, data["pitch_inv"], pitch_batch_size),
+            data["pitch_inv weight"] / data["pitch_inv"] ** 3,
         ) / bounce.compute_fieldline_length(fl_quad, vander)
 
     grid = transforms["grid"]
-    B0 = data["max_tz |B|"]
-    data["effective ripple 3/2"] = (
+    B0 = grid.compress(data["max_tz |B|"])
+    data["effective ripple 3/2"] = grid.expand(
         _compute(
             eps_32,
             {"|grad(rho)|*kappa_g": data["|grad(rho)|"] * data["kappa_g"]},
@@ -284,8 +294,9 @@ def _epsilon_32(params, transforms, profiles, data, **kwargs):
             num_pitch,
             surf_batch_size,
             simp=True,
+            expand_out=False,
         )
-        * (B0 * data["R0"] / data["<|grad(rho)|>"]) ** 2
+        * (B0 * data["R0"] / grid.compress(data["<|grad(rho)|>"])) ** 2
         * (jnp.pi / (8 * 2**0.5))
     )
     return data
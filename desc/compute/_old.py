@@ -5,20 +5,16 @@ These do not appear in the public documentation under the list of variables.
 
 from functools import partial
 
-from orthax.legendre import leggauss
+from quadax import quadgk
 
 from desc.backend import jit, jnp
 
 from ..batching import batch_map
 from ..integrals.bounce_integral import Bounce1D
-from ..integrals.quad_utils import (
-    automorphism_sin,
-    chebgauss2,
-    get_quadrature,
-    grad_automorphism_sin,
-)
+from ..integrals.quad_utils import _chebgauss2, _leggauss_sin
 from ..utils import cross, dot, safediv
 from ._fast_ion import _drift1, _drift2, _radial_drift, _v_tau
+from ._geometry import _mean_fieldline_integral
 from ._neoclassical import _bounce_doc, _dH_ripple, _dI_ripple
 from .data_index import register_compute_fun
 
@@ -31,7 +27,16 @@ _bounce1D_doc = {
 }
 
 
-def _compute(fun, fun_data, data, grid, num_pitch, surf_batch_size=1, simp=False):
+def _compute(
+    fun,
+    fun_data,
+    data,
+    grid,
+    num_pitch,
+    surf_batch_size=1,
+    simp=False,
+    expand_out=True,
+):
     """Compute Bounce1D integral quantity with ``fun``.
 
     Parameters
@@ -39,7 +44,9 @@ def _compute(fun, fun_data, data, grid, num_pitch, surf_batch_size=1, simp=False
     fun : callable
         Function to compute.
     fun_data : dict[str, jnp.ndarray]
+        Shape (grid.num_nodes, ).
         Data to provide to ``fun``. This dict will be modified.
+        Values must be scalar-valued functions evaluated on ``grid``.
     data : dict[str, jnp.ndarray]
         DESC data dict.
     grid : Grid
@@ -51,12 +58,20 @@ def _compute(fun, fun_data, data, grid, num_pitch, surf_batch_size=1, simp=False
         Default is ``1``.
     simp : bool
         Whether to use an open Simpson rule instead of uniform weights.
+    expand_out : bool
+        Whether to expand output to full grid so that the first dimension
+        has size ``grid.num_nodes`` instead of ``grid.num_rho``.
+        Default is True.
 
     """
     for name in Bounce1D.required_names:
         fun_data[name] = data[name]
-    for name in fun_data:
-        fun_data[name] = Bounce1D.reshape(grid, fun_data[name])
+    names = list(fun_data)
+    assert all(
+        fun_data[name].shape == (grid.num_nodes,) for name in names
+    ), "Expected scalar-valued data on grid."
+    f = Bounce1D.reshape(grid, jnp.stack([fun_data[name] for name in names], axis=-1))
+    fun_data.update(zip(names, jnp.moveaxis(f, -1, 0)))
     fun_data["pitch_inv"], fun_data["pitch_inv weight"] = Bounce1D.get_pitch_inv_quad(
         grid.compress(data["min_tz |B|"]),
         grid.compress(data["max_tz |B|"]),
@@ -64,8 +79,22 @@ def _compute(fun, fun_data, data, grid, num_pitch, surf_batch_size=1, simp=False
         simp=simp,
     )
     out = batch_map(fun, fun_data, surf_batch_size)
-    assert out.ndim == 1
-    return grid.expand(out)
+    if expand_out:
+        assert out.ndim == 1
+        return grid.expand(out)
+    return out
+
+
+def _bounce1d_fieldline_length(grid, data):
+    """Compute ``fieldline length`` from data of ``Bounce1D.reshape``.
+
+    This is evaluated inside the map over flux surfaces so that it is computed
+    in the same pass as the bounce integrals instead of as a separate quantity
+    over the full grid that is then expanded.
+    """
+    return _mean_fieldline_integral(
+        1 / data["B^zeta"], grid.compress(grid.nodes[:, 2], surface_label="zeta")
+    )
 
 
 @register_compute_fun(
@@ -92,14 +121,30 @@ def _compute(fun, fun_data, data, grid, num_pitch, surf_batch_size=1, simp=False
         "R0",
         "|grad(rho)|",
         "<|grad(rho)|>",
-        "fieldline length",
     ]
     + Bounce1D.required_names,
     source_grid_requirement={"coordinates": "raz", "is_meshgrid": True},
     public=False,
     **_bounce1D_doc,
+    adaptive="""bool :
+        Whether to compute the bounce integrals with adaptive Gauss-Kronrod
+        quadrature after a change of variable that removes the singularities
+        at the bounce points. Default is false.
+        If true, then ``num_quad`` and ``quad`` are ignored.
+        This is more expensive than the fixed rule since every well is
+        refined as often as the slowest one to converge.
+        """,
+)
+@partial(
+    jit,
+    static_argnames=[
+        "num_well",
+        "num_quad",
+        "num_pitch",
+        "surf_batch_size",
+        "adaptive",
+    ],
 )
-@partial(jit, static_argnames=["num_well", "num_quad", "num_pitch", "surf_batch_size"])
 def _epsilon_32_1D(params, transforms, profiles, data, **kwargs):
     """Effective ripple modulation amplitude to 3/2 power.
 
@@ -113,8 +158,11 @@ def _epsilon_32_1D(params, transforms, profiles, data, **kwargs):
     num_pitch = kwargs.get("num_pitch", 51)
     surf_batch_size = kwargs.get("surf_batch_size", 1)
     quad = (
-        kwargs["quad"] if "quad" in kwargs else chebgauss2(kwargs.get("num_quad", 32))
+        kwargs["quad"] if "quad" in kwargs else _chebgauss2(kwargs.get("num_quad", 32))
     )
+    # Wells that span several toroidal transits touch 1/λ at interior maxima
+    # of |B|, so they need many more subintervals than quadgk's default of 50.
+    adaptive = partial(quadgk, max_ninter=1000) if kwargs.get("adaptive") else None
 
     def eps_32(data):
         """(∂ψ/∂ρ)⁻² B₀⁻³ ∫ dλ λ⁻² ∑ⱼ Hⱼ²/Iⱼ."""
@@ -128,17 +176,18 @@ def _epsilon_32_1D(params, transforms, profiles, data, **kwargs):
             data,
             "|grad(rho)|*kappa_g",
             num_well=num_well,
+            quad=adaptive,
         )
-        return jnp.sum(
-            safediv(H**2, I).sum(-1).mean(-2)
-            * data["pitch_inv weight"]
-            / data["pitch_inv"] ** 3,
-            axis=-1,
-        )
+        # Contract over pitch and wells in one reduction and average over alpha.
+        return jnp.einsum(
+            "...apw,...p->...",
+            safediv(H**2, I),
+            data["pitch_inv weight"] / data["pitch_inv"] ** 3,
+        ) / (H.shape[-3] * _bounce1d_fieldline_length(grid, data))
 
     grid = transforms["grid"].source_grid
-    B0 = data["max_tz |B|"]
-    data["old effective ripple 3/2"] = (
+    B0 = grid.compress(data["max_tz |B|"])
+    data["old effective ripple 3/2"] = grid.expand(
         _compute(
             eps_32,
             {"|grad(rho)|*kappa_g": data["|grad(rho)|"] * data["kappa_g"]},
@@ -147,9 +196,9 @@ def _epsilon_32_1D(params, transforms, profiles, data, **kwargs):
             num_pitch,
             surf_batch_size,
             simp=True,
+            expand_out=False,
         )
-        / data["fieldline length"]
-        * (B0 * data["R0"] / data["<|grad(rho)|>"]) ** 2
+        * (B0 * data["R0"] / grid.compress(data["<|grad(rho)|>"])) ** 2
         * (jnp.pi / (8 * 2**0.5))
     )
     return data
@@ -211,7 +260,6 @@ def _effective_ripple_1D(params, transforms, profiles, data, **kwargs):
         "|e_alpha|r,p|",
         "kappa_g",
         "iota_r",
-        "fieldline length",
     ]
     + Bounce1D.required_names,
     source_grid_requirement={"coordinates": "raz", "is_meshgrid": True},
@@ -246,10 +294,7 @@ def _Gamma_c_1D(params, transforms, profiles, data, **kwargs):
     quad = (
         kwargs["quad"]
         if "quad" in kwargs
-        else get_quadrature(
-            leggauss(kwargs.get("num_quad", 32)),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        else _leggauss_sin(kwargs.get("num_quad", 32))
     )
 
     def Gamma_c(data):
@@ -275,7 +320,7 @@ def _Gamma_c_1D(params, transforms, profiles, data, **kwargs):
             * data["pitch_inv weight"]
             / data["pitch_inv"] ** 2,
             axis=-1,
-        ) / (2**1.5 * jnp.pi)
+        ) / (_bounce1d_fieldline_length(grid, data) * 2**1.5 * jnp.pi)
 
     fun_data = {
         "|grad(psi)|*kappa_g": data["|grad(psi)|"] * data["kappa_g"],
@@ -286,9 +331,8 @@ def _Gamma_c_1D(params, transforms, profiles, data, **kwargs):
         - (2 * data["|B|_r|v,p"] - data["|B|"] * data["B^phi_r|v,p"] / data["B^phi"]),
     }
     grid = transforms["grid"].source_grid
-    data["old Gamma_c"] = (
-        _compute(Gamma_c, fun_data, data, grid, num_pitch, surf_batch_size)
-        / data["fieldline length"]
+    data["old Gamma_c"] = _compute(
+        Gamma_c, fun_data, data, grid, num_pitch, surf_batch_size
     )
     return data
 
@@ -315,8 +359,7 @@ def _poloidal_drift(data, B, pitch):
     transforms={"grid": []},
     profiles=[],
     coordinates="r",
-    data=["min_tz |B|", "max_tz |B|", "cvdrift0", "gbdrift", "fieldline length"]
-    + Bounce1D.required_names,
+    data=["min_tz |B|", "max_tz |B|", "cvdrift0", "gbdrift"] + Bounce1D.required_names,
     source_grid_requirement={"coordinates": "raz", "is_meshgrid": True},
     public=False,
     **_bounce1D_doc,
@@ -344,10 +387,7 @@ def _Gamma_c_Velasco_1D(params, transforms, profiles, data, **kwargs):
     quad = (
         kwargs["quad"]
         if "quad" in kwargs
-        else get_quadrature(
-            leggauss(kwargs.get("num_quad", 32)),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        else _leggauss_sin(kwargs.get("num_quad", 32))
     )
 
     def Gamma_c(data):
@@ -366,18 +406,15 @@ def _Gamma_c_Velasco_1D(params, transforms, profiles, data, **kwargs):
             * data["pitch_inv weight"]
             / data["pitch_inv"] ** 2,
             axis=-1,
-        ) / (2**1.5 * jnp.pi)
+        ) / (_bounce1d_fieldline_length(grid, data) * 2**1.5 * jnp.pi)
 
     grid = transforms["grid"].source_grid
-    data["old Gamma_c Velasco"] = (
-        _compute(
-            Gamma_c,
-            {"cvdrift0": data["cvdrift0"], "gbdrift": data["gbdrift"]},
-            data,
-            grid,
-            num_pitch,
-            surf_batch_size,
-        )
-        / data["fieldline length"]
+    data["old Gamma_c Velasco"] = _compute(
+        Gamma_c,
+        {"cvdrift0": data["cvdrift0"], "gbdrift": data["gbdrift"]},
+        data,
+        grid,
+        num_pitch,
+        surf_batch_size,
     )
     return data
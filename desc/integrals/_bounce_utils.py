@@ -205,6 +205,35 @@ def _check_bounce_points(z1, z2, pitch_inv, knots, B, plot=True, **kwargs):
     return plots
 
 
+def _check_adaptive(z1, z2, status):
+    """Check that adaptive quadrature converged on every bounce integral.
+
+    Parameters
+    ----------
+    z1, z2 : jnp.ndarray
+        Shape (..., num well).
+        ζ coordinates of bounce points.
+    status : jnp.ndarray
+        Shape (..., num well).
+        Termination flag of the adaptive quadrature for each integral.
+        Zero means the requested tolerance was reached.
+
+    """
+    failed = status != 0
+    if failed.any():
+        z1 = jnp.broadcast_to(z1, failed.shape)
+        z2 = jnp.broadcast_to(z2, failed.shape)
+        idx = jnp.nonzero(failed)
+        print("Adaptive quadrature did not converge for the integrals at")
+        print(jnp.column_stack(idx))
+        print("      z1    |    z2")
+        print(jnp.column_stack([z1[idx], z2[idx]]))
+    assert not failed.any(), (
+        f"{failed.sum()} bounce integrals did not converge. "
+        "Increase max_ninter of the adaptive quadrature.\n"
+    )
+
+
 def _check_interp(zeta, b_sup_z, B, f, result, plot=True):
     """Check for interpolation failures and floating point issues.
 
@@ -778,21 +807,30 @@ def _move(f, out=True):
     return jnp.moveaxis(f, s, d)
 
 
-def _mmt_for_bounce(v, c):
-    """Matrix multiplication transform.
+def _mmt_for_bounce(v_zeta, v_theta, c):
+    """Matrix multiplication transform with partial summation.
+
+    Sums over the toroidal modes first with a matrix product and then over the
+    poloidal modes, so the 2D Vandermonde array of shape
+    (..., num zeta modes, num theta modes) is never formed.
 
     Parameters
     ----------
-    v : jnp.ndarray
-        Shape (num rho, num alpha, num pitch, num well, num quad,
-                num zeta modes, num theta modes).
-        Vandermonde array.
+    v_zeta : jnp.ndarray
+        Shape (num rho, num alpha, num pitch, num well, num quad, num zeta modes).
+        Vandermonde array for toroidal modes.
+    v_theta : jnp.ndarray
+        Shape (num rho, num alpha, num pitch, num well, num quad, num theta modes).
+        Vandermonde array for poloidal modes.
     c : jnp.ndarray
         Shape (num rho, 1, num zeta modes, num theta modes).
         Fourier coefficients.
 
     """
-    return (v * c[..., None, None, None, :, :]).real.sum((-2, -1))
+    v_zeta = v_zeta.reshape(*v_zeta.shape[:-4], -1, v_zeta.shape[-1])
+    f = jnp.matmul(v_zeta, c)
+    f = f.reshape(*f.shape[:-2], *v_theta.shape[-4:])
+    return (f * v_theta).real.sum(-1)
 
 
 def _broadcast_for_bounce(pitch_inv):
@@ -3,7 +3,7 @@
 import warnings
 from abc import ABC, abstractmethod
 
-from interpax import CubicHermiteSpline, PPoly
+from interpax import CubicHermiteSpline, PPoly, interp1d
 from orthax.legendre import leggauss
 
 from desc.backend import jnp, rfft2
@@ -11,6 +11,7 @@ from desc.batching import batch_map
 from desc.grid import LinearGrid
 from desc.integrals._bounce_utils import (
     _broadcast_for_bounce,
+    _check_adaptive,
     _check_bounce_points,
     _check_interp,
     _mmt_for_bounce,
@@ -36,17 +37,15 @@ from desc.integrals._interp_utils import (
     nufft2d2r,
     polyder_vec,
     rfft2_modes,
-    rfft2_vander,
 )
 from desc.integrals.basis import PiecewiseChebyshevSeries
 from desc.integrals.quad_utils import (
+    _pitch_inv_quad_unit,
     automorphism_sin,
     bijection_from_disc,
     get_quadrature,
     grad_automorphism_sin,
     grad_bijection_from_disc,
-    simpson2,
-    uniform,
 )
 from desc.io import IOAble
 from desc.utils import apply, atleast_nd, errorif, flatten_mat, setdefault
@@ -82,10 +81,7 @@ class Bounce(IOAble, ABC):
             msg="Floating point error impedes detection of bounce points "
             f"near global extrema. Choose {num_pitch} < 1e5.",
         )
-        # Samples should be uniformly spaced in |B| and not λ.
-        # Important to do an open quadrature since the bounce integrals at the
-        # global maxima of |B| are not computable even ignoring precision issues.
-        x, w = simpson2(num_pitch) if simp else uniform(num_pitch)
+        x, w = _pitch_inv_quad_unit(num_pitch, simp)
         x = bijection_from_disc(x, min_B[..., None], max_B[..., None])
         w = w * grad_bijection_from_disc(min_B, max_B)[..., None]
         return x, w
@@ -690,7 +686,7 @@ class Bounce2D(Bounce):
             and pitch value.
 
         """
-        x, w = self._x, self._w if quad is None else quad
+        x, w = (self._x, self._w) if quad is None else quad
         if not isinstance(integrand, (list, tuple)):
             integrand = [integrand]
         if isinstance(names, str):
@@ -730,10 +726,11 @@ class Bounce2D(Bounce):
         # B⋅∇ζ > 0. This is equivalent to changing the sign of ∇ζ
         # or (∂ℓ/∂ζ)|ρ,a. Recall dζ = ∇ζ⋅dR ⇔ 1 = ∇ζ⋅(e_ζ|ρ,a).
         cov = grad_bijection_from_disc(z1, z2)
-        result = [
-            (f(data, data["|B|"], pitch) * data["|e_zeta|r,a|"]).dot(w) * cov
-            for f in integrand
-        ]
+        # Stack the integrands so that all quadratures are one reduction.
+        result = jnp.stack(
+            jnp.broadcast_arrays(*(f(data, data["|B|"], pitch) for f in integrand))
+        )
+        result = list((result * data["|e_zeta|r,a|"]).dot(w) * cov)
 
         if check:
             _check_interp(
@@ -761,10 +758,11 @@ class Bounce2D(Bounce):
         return dict(zip([*data.keys(), "B^zeta", "|B|"], c))
 
     def _nummt(self, zeta, theta, data):
-        v = rfft2_vander(zeta, theta, self._n_modes, self._m_modes)
-        data = {name: _mmt_for_bounce(v, c) for name, c in data.items()}
-        data["B^zeta"] = _mmt_for_bounce(v, self._c["B^zeta"])
-        data["|B|"] = _mmt_for_bounce(v, self._c["|B|"])
+        v_zeta = jnp.exp(1j * self._n_modes * zeta[..., None])
+        v_theta = jnp.exp(1j * self._m_modes * theta[..., None])
+        data = {name: _mmt_for_bounce(v_zeta, v_theta, c) for name, c in data.items()}
+        data["B^zeta"] = _mmt_for_bounce(v_zeta, v_theta, self._c["B^zeta"])
+        data["|B|"] = _mmt_for_bounce(v_zeta, v_theta, self._c["|B|"])
         return data
 
     def interp_to_argmin(self, f, points, *, nufft_eps=1e-6, is_fourier=False):
@@ -1262,9 +1260,19 @@ class Bounce1D(Bounce):
             Method of interpolation.
             See https://interpax.readthedocs.io/en/latest/_api/interpax.interp1d.html.
             Default is cubic C1 local spline.
-        quad : tuple[jnp.ndarray]
+        quad : tuple[jnp.ndarray] or callable
             Optional quadrature points and weights. If given this overrides
             the quadrature chosen when this object was made.
+            May also be an adaptive quadrature routine from ``quadax`` such as
+            ``quadax.quadgk``. Then each well is integrated adaptively after
+            the change of variable ``automorphism_sin``.
+            This is more expensive than a fixed rule since every well, including
+            those that pad ``num_well``, is refined as often as the slowest one.
+            Wells that span several toroidal transits need many more subintervals
+            than the default ``max_ninter=50`` of ``quadax.quadgk``, which does not
+            converge on such wells, so pass e.g.
+            ``functools.partial(quadax.quadgk, max_ninter=1000)``.
+            Set ``check`` to verify that every well converged.
         check : bool
             Flag for debugging. Must be false for JAX transformations.
         plot : bool
@@ -1279,7 +1287,6 @@ class Bounce1D(Bounce):
             and pitch value.
 
         """
-        x, w = self._x, self._w if quad is None else quad
         if not isinstance(integrand, (list, tuple)):
             integrand = [integrand]
         if isinstance(names, str):
@@ -1291,6 +1298,13 @@ class Bounce1D(Bounce):
             points = self.points(pitch_inv, num_well)
         pitch = jnp.atleast_1d(1 / _broadcast_for_bounce(pitch_inv))[..., None]
 
+        if callable(quad):
+            result = self._integrate_adaptive(
+                quad, integrand, pitch, data, *points, method, check
+            )
+            return result[0] if len(result) == 1 else result
+
+        x, w = (self._x, self._w) if quad is None else quad
         if kwargs.get("batch", True):
             pitch = pitch[..., None]
             result = self._integrate(
@@ -1358,7 +1372,11 @@ class Bounce1D(Bounce):
         # B⋅∇ζ > 0. This is equivalent to changing the sign of ∇ζ
         # or (∂ℓ/∂ζ)|ρ,a. Recall dζ = ∇ζ⋅dR ⇔ 1 = ∇ζ⋅(e_ζ|ρ,a).
         cov = grad_bijection_from_disc(z1, z2)
-        result = [(f(data, B, pitch) / b_sup_z).dot(w) * cov for f in integrand]
+        # Stack the integrands so that all quadratures are one reduction.
+        result = jnp.stack(
+            jnp.broadcast_arrays(*(f(data, B, pitch) for f in integrand))
+        )
+        result = list((result / b_sup_z).dot(w) * cov)
 
         if check:
             _check_interp(
@@ -1372,6 +1390,46 @@ class Bounce1D(Bounce):
 
         return result
 
+    def _integrate_adaptive(self, quad, integrand, pitch, data, z1, z2, method, check):
+        names = list(data)
+
+        def fun(x, z1, z2, pitch, knots, B, B_z, b_sup_z, b_sup_z_z, *f):
+            zeta = bijection_from_disc(automorphism_sin(x), z1, z2)
+            B = interp1d(zeta, knots, B, method="cubic", fx=B_z)
+            b_sup_z = interp1d(zeta, knots, b_sup_z, method="cubic", fx=b_sup_z_z)
+            f = {
+                name: interp1d(zeta, knots, v, method=method)
+                for name, v in zip(names, f)
+            }
+            # Including the Jacobian of the bijection makes the integrand vanish
+            # identically on the padded wells where z1 = z2, so they contribute 0.
+            return (
+                jnp.stack([g(f, B, pitch) for g in integrand])
+                / b_sup_z
+                * grad_automorphism_sin(x)
+                * grad_bijection_from_disc(z1, z2)
+            )
+
+        def well(z1, z2, pitch, knots, *f):
+            result, info = quad(fun, jnp.array([-1.0, 1.0]), (z1, z2, pitch, knots, *f))
+            return result, info.status
+
+        f = [
+            self._data["|B|"],
+            self._data["|B|_z|r,a"],
+            self._data["|b^zeta|"],
+            self._data["|b^zeta|_z|r,a"],
+            *data.values(),
+        ]
+        # The adaptive loop is vectorized over all wells, including padding,
+        # so every well runs as many iterations as the slowest one to converge.
+        result, status = jnp.vectorize(
+            well, signature="(),(),(),(n)" + ",(n)" * len(f) + "->(k),()"
+        )(z1, z2, pitch, self._zeta, *(v[..., None, None, :] for v in f))
+        if check:
+            _check_adaptive(z1, z2, status)
+        return list(jnp.moveaxis(result, -1, 0))
+
     def interp_to_argmin(self, f, points, *, method="cubic"):
         """Interpolate ``f`` to the deepest point pⱼ in magnetic well j.
 
@@ -13,10 +13,13 @@ The clustering of the nodes near the singularities is sufficient to estimate
 k(ζ, λ).
 """
 
+from functools import lru_cache
+
+import numpy as np
 from orthax.chebyshev import chebgauss, chebweight
-from orthax.legendre import legder, legval
+from orthax.legendre import legder, leggauss, legval
 
-from desc.backend import eigh_tridiagonal, jnp, put
+from desc.backend import eigh_tridiagonal, ensure_compile_time_eval, jnp, put
 from desc.utils import errorif
 
 
@@ -329,3 +332,41 @@ def get_quadrature(quad, automorphism):
         w = w * grad_auto(x)
         x = auto(x)
     return x, w
+
+
+def _read_only(x, w):
+    """Return NumPy quadrature that is safe to share between callers."""
+    x, w = np.asarray(x), np.asarray(w)
+    x.setflags(write=False)
+    w.setflags(write=False)
+    return x, w
+
+
+# The quadratures below are cached so that repeated traces and rebuilds share
+# them. They are evaluated eagerly so that a cached value is never a tracer.
+
+
+@lru_cache(maxsize=16)
+def _chebgauss2(deg):
+    """Return ``chebgauss2(deg)``."""
+    with ensure_compile_time_eval():
+        return _read_only(*chebgauss2(deg))
+
+
+@lru_cache(maxsize=16)
+def _leggauss_sin(deg):
+    """Return ``leggauss(deg)`` with the change of variable ``automorphism_sin``."""
+    with ensure_compile_time_eval():
+        return _read_only(
+            *get_quadrature(leggauss(deg), (automorphism_sin, grad_automorphism_sin))
+        )
+
+
+@lru_cache(maxsize=16)
+def _pitch_inv_quad_unit(num_pitch, simp):
+    """Return quadrature over 1/λ on the reference interval [-1, 1]."""
+    # Samples should be uniformly spaced in |B| and not λ.
+    # Important to do an open quadrature since the bounce integrals at the
+    # global maxima of |B| are not computable even ignoring precision issues.
+    with ensure_compile_time_eval():
+        return _read_only(*(simpson2(num_pitch) if simp else uniform(num_pitch)))
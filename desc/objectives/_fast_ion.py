@@ -5,17 +5,14 @@ import warnings
 import numpy as np
 from orthax.legendre import leggauss
 
+from desc.backend import jnp
 from desc.compute import get_profiles, get_transforms
 from desc.compute.utils import _compute as compute_fun
 from desc.grid import LinearGrid
 from desc.integrals._interp_utils import cheb_pts, fourier_pts
 from desc.utils import parse_argname_change, setdefault, warnif
 
-from ..integrals.quad_utils import (
-    automorphism_sin,
-    get_quadrature,
-    grad_automorphism_sin,
-)
+from ..integrals.quad_utils import _leggauss_sin
 from ._neoclassical import _bounce_overwrite, _get_vander
 from .objective_funs import _Objective, collect_docs
 from .utils import _parse_callable_target_bounds
@@ -259,10 +256,7 @@ class GammaC(_Objective):
         x, w = leggauss(self._hyperparam["Y_B"] // 2)
         self._constants["_vander"] = _get_vander(self, x)
         self._constants["fieldline quad"] = (x, w)
-        self._constants["quad"] = get_quadrature(
-            leggauss(self._hyperparam.pop("num_quad")),
-            (automorphism_sin, grad_automorphism_sin),
-        )
+        self._constants["quad"] = _leggauss_sin(self._hyperparam.pop("num_quad"))
         self._constants["profiles"] = get_profiles(self._key, eq, grid=self._grid)
         self._constants["transforms"] = get_transforms(self._key, eq, grid=self._grid)
 
@@ -354,9 +348,7 @@ class GammaC(_Objective):
 
         rho = self._grid.compress(self._grid.nodes[:, 0])
         self._constants["rho"] = rho
-        self._constants["quad"] = get_quadrature(
-            leggauss(num_quad), (automorphism_sin, grad_automorphism_sin)
-        )
+        self._constants["quad"] = _leggauss_sin(num_quad)
         self._constants["profiles"] = get_profiles(
             self._keys_1dr + [self._key], eq, self._grid
         )
@@ -392,10 +384,11 @@ class GammaC(_Objective):
             iota=self._grid.compress(data["iota"]),
             params=params,
         )
-        data = {
-            key: grid.copy_data_from_other(data[key], self._grid)
-            for key in self._keys_1dr
-        }
+        # Copy all the radial profiles to the new grid in one gather.
+        data_1dr = grid.copy_data_from_other(
+            jnp.column_stack([data[key] for key in self._keys_1dr]), self._grid
+        )
+        data = dict(zip(self._keys_1dr, data_1dr.T))
         data = compute_fun(
             eq,
             self._key,
@@ -12,7 +12,7 @@ from desc.grid import LinearGrid
 from desc.integrals._interp_utils import bijection_from_disc, cheb_pts, fourier_pts
 from desc.utils import parse_argname_change, setdefault, warnif
 
-from ..integrals.quad_utils import chebgauss2
+from ..integrals.quad_utils import _chebgauss2
 from .objective_funs import _Objective, collect_docs
 from .utils import _parse_callable_target_bounds
 
@@ -245,7 +245,7 @@ class EffectiveRipple(_Objective):
         x, w = leggauss(self._hyperparam["Y_B"] // 2)
         self._constants["_vander"] = _get_vander(self, x)
         self._constants["fieldline quad"] = (x, w)
-        self._constants["quad"] = chebgauss2(self._hyperparam.pop("num_quad"))
+        self._constants["quad"] = _chebgauss2(self._hyperparam.pop("num_quad"))
         self._constants["profiles"] = get_profiles(
             "effective ripple", eq, grid=self._grid
         )
@@ -347,7 +347,7 @@ class EffectiveRipple(_Objective):
 
         rho = self._grid.compress(self._grid.nodes[:, 0])
         self._constants["rho"] = rho
-        self._constants["quad"] = chebgauss2(num_quad)
+        self._constants["quad"] = _chebgauss2(num_quad)
         self._constants["profiles"] = get_profiles(
             self._keys_1dr + ["old effective ripple"], eq, self._grid
         )
@@ -383,14 +383,12 @@ class EffectiveRipple(_Objective):
             iota=self._grid.compress(data["iota"]),
             params=params,
         )
-        data = {
-            key: (
-                grid.copy_data_from_other(data[key], self._grid)
-                if key != "R0"
-                else data[key]
-            )
-            for key in self._keys_1dr
-        }
+        # Copy all the radial profiles to the new grid in one gather.
+        keys = [key for key in self._keys_1dr if key != "R0"]
+        data_1dr = grid.copy_data_from_other(
+            jnp.column_stack([data[key] for key in keys]), self._grid
+        )
+        data = {"R0": data["R0"], **dict(zip(keys, data_1dr.T))}
         data = compute_fun(
             eq,
             "old effective ripple",
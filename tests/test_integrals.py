@@ -8,6 +8,7 @@ from jax import grad
 from matplotlib import pyplot as plt
 from numpy.polynomial.chebyshev import chebinterpolate, chebroots
 from numpy.polynomial.legendre import leggauss
+from quadax import quadgk
 from scipy import integrate
 from scipy.interpolate import CubicHermiteSpline
 from scipy.special import ellipe, ellipk, ellipkm1
@@ -1215,6 +1216,67 @@ class TestBounce:
             bounce.interp_to_argmin(h(zeta), points), h(argmin_g), rtol=1e-3
         )
 
+    @pytest.mark.unit
+    def test_integrate_quad_override(self):
+        """Test that quadrature given to integrate overrides the default."""
+        knots = np.linspace(-np.pi / 2, np.pi / 2, 50)
+        B = np.sin(knots) ** 2 + 1
+        dB_dz = np.sin(2 * knots)
+        grid = Grid.create_meshgrid([1, 0, knots], coordinates="raz")
+        data = {"B^zeta": B, "B^zeta_z|r,a": dB_dz, "|B|": B, "|B|_z|r,a": dB_dz}
+        quad = get_quadrature(leggauss(25), auto_sin)
+        coarse = Bounce1D(grid, data, quad=leggauss(3), automorphism=auto_sin)
+        fine = Bounce1D(grid, data, quad=quad)
+
+        pitch_inv = 1.8
+        integrand = lambda data, B, pitch: 1 / jnp.sqrt(1 - pitch * B)
+        truth = fine.integrate(integrand, pitch_inv)
+        assert not np.allclose(coarse.integrate(integrand, pitch_inv), truth)
+        np.testing.assert_allclose(
+            coarse.integrate(integrand, pitch_inv, quad=quad), truth
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("is_strong", [True, False])
+    def test_integrate_adaptive(self, is_strong):
+        """Test adaptive quadrature matches singular elliptic integrals."""
+        # Same problem as TestBounceQuadrature.test_bounce_quadrature.
+        v = 3
+        knots = np.linspace(-np.pi / 2 * v, np.pi / 2 * v, 50)
+        B = np.sin(knots / v) ** 2 + 1
+        dB_dz = np.sin(2 * knots / v) / v
+        bounce = Bounce1D(
+            Grid.create_meshgrid([1, 0, knots], coordinates="raz"),
+            data={"B^zeta": B, "B^zeta_z|r,a": dB_dz, "|B|": B, "|B|_z|r,a": dB_dz},
+            quad=leggauss(25),
+            automorphism=auto_sin,
+        )
+
+        m = 1 - 1e-3
+        pitch_inv = 2 - 1e-12
+        k = pitch_inv * m
+        if is_strong:
+            integrand = lambda data, B, pitch: 1 / jnp.sqrt(1 - k * pitch * (B - 1))
+            truth = v * 2 * ellipkm1(1 - m)
+        else:
+            integrand = lambda data, B, pitch: jnp.sqrt(1 - k * pitch * (B - 1))
+            truth = v * 2 * ellipe(m)
+        # Request more wells than exist to also test the padding.
+        adaptive = bounce.integrate(
+            integrand, pitch_inv, num_well=3, quad=quadgk, check=True
+        )
+        fixed = bounce.integrate(integrand, pitch_inv, num_well=3)
+        np.testing.assert_allclose(adaptive.sum(), truth, rtol=1e-4)
+        np.testing.assert_allclose(adaptive, fixed, rtol=1e-4, atol=1e-12)
+        with pytest.raises(AssertionError, match="did not converge"):
+            bounce.integrate(
+                integrand,
+                pitch_inv,
+                num_well=3,
+                quad=partial(quadgk, max_ninter=2, epsabs=1e-14, epsrel=1e-14),
+                check=True,
+            )
+
     @staticmethod
     def get_drift_analytic_data():
         """Get data to compute bounce averaged binormal drift analytically."""
@@ -1533,6 +1595,35 @@ class TestBounce2D:
             rtol=1e-6,
         )
 
+    @pytest.mark.unit
+    def test_integrate_quad_override(self):
+        """Test that quadrature given to integrate overrides the default."""
+        nyquist = 2 * 7 + 1
+        grid = LinearGrid(theta=1, zeta=nyquist, sym=False)
+        zeta = grid.nodes[:, 2]
+        data = dict.fromkeys(Bounce2D.required_names, 2 + np.sin(zeta) ** 2)
+        kwargs = dict(
+            grid=grid,
+            data=data,
+            # dummy value; |B| depends on ζ alone, so doesn't matter what θ(α, ζ) is
+            theta=Bounce2D.reshape(grid, grid.nodes[:, 1]),
+            Y_B=2 * nyquist,
+            num_transit=1,
+        )
+        quad = get_quadrature(leggauss(25), auto_sin)
+        coarse = Bounce2D(**kwargs, quad=leggauss(3), automorphism=auto_sin)
+        fine = Bounce2D(**kwargs, quad=quad)
+
+        pitch_inv = np.array([[2.8]])
+        integrand = lambda data, B, pitch: 1 / jnp.sqrt(1 - pitch * B)
+        truth = fine.integrate(integrand, pitch_inv, num_well=2)
+        assert not np.allclose(
+            coarse.integrate(integrand, pitch_inv, num_well=2), truth
+        )
+        np.testing.assert_allclose(
+            coarse.integrate(integrand, pitch_inv, num_well=2, quad=quad), truth
+        )
+
     @pytest.mark.unit
     @pytest.mark.mpl_image_compare(remove_text=True, tolerance=tol_1d * 4)
     def test_bounce2d_checks(self):
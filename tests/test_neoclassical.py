@@ -84,6 +84,39 @@ def test_effective_ripple_1D():
     return fig
 
 
+@pytest.mark.unit
+@pytest.mark.slow
+def test_effective_ripple_1D_adaptive():
+    """Test effective ripple 1D with adaptive quadrature matches converged rule."""
+    eq = get("W7-X")
+    Y_B = 64
+    num_transit = 4
+    num_well = 15 * num_transit
+    rho = np.array([0.2, 0.6, 1.0])
+    alpha = np.array([0])
+    zeta = np.linspace(0, num_transit * 2 * np.pi, num_transit * Y_B)
+    grid = Grid.create_meshgrid([rho, alpha, zeta], coordinates="raz")
+    fixed = eq.compute(
+        "old effective ripple 3/2",
+        grid=grid,
+        num_well=num_well,
+        num_pitch=20,
+        num_quad=128,
+    )
+    adaptive = eq.compute(
+        "old effective ripple 3/2",
+        grid=grid,
+        num_well=num_well,
+        num_pitch=20,
+        adaptive=True,
+    )
+    np.testing.assert_allclose(
+        grid.compress(adaptive["old effective ripple 3/2"]),
+        grid.compress(fixed["old effective ripple 3/2"]),
+        rtol=1e-3,
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.slow
 def test_fieldline_average():